@@ -1,70 +1,206 @@
 import bpy
-import urllib.request
 import os
+import hashlib
 import json
+import pickle
+import queue
+import shutil
+import sys
+import threading
 from bpy.props import StringProperty, BoolProperty, EnumProperty, PointerProperty
-from datetime import datetime
+
+# orjson is much faster than the stdlib parser but is not bundled with Blender.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # --- Constants ---
 SENSORS_URL = "https://raw.githubusercontent.com/EmberLightVFX/Camera-Sensor-Database/refs/heads/main/data/sensors.json"
 API_URL = "https://api.github.com/repos/EmberLightVFX/Camera-Sensor-Database/contents/data/sensors.json"
+# The JSON compresses well; urllib3 transparently decodes gzip responses.
+REQUEST_HEADERS = {'Accept-Encoding': 'gzip', 'User-Agent': 'blender-camera-sensor-database'}
 
 # --- Global Data ---
 SENSOR_DATA = {}
 
+# The data is loaded on first use rather than in register() to keep it off
+# Blender's startup path.
+_DATA_LOADED = False
+
+# Shared connection pool, created on the first request so repeated requests
+# to GitHub reuse the same TLS connection.
+_HTTP = None
+
+# Flat lookup tables built from SENSOR_DATA at load time, keyed by
+# (manufacturer, model, format). The enum item tuples are pre-sorted so the
+# callbacks Blender runs on every redraw are a single lookup, and they stay
+# alive for as long as Blender needs them.
+SENSOR_DIMS = {}
+SENSOR_RES = {}
+MFRS_SORTED = ()
+MODELS_BY_MFR = {}
+FORMATS_BY = {}
+
+# Enum items shown when there is nothing to choose from. Blender only reads
+# the returned items, so the same tuples are handed back on every call.
+FALLBACK_NONE = (("NONE", "No Data Found", "Please download the database in Add-on Preferences."),)
+FALLBACK_NA = (("NONE", "N/A", ""),)
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 # --- Helper Functions ---
+def get_timestamp():
+    """Format the current time like strftime("%B %d, %Y at %I:%M %p"), without locale lookups."""
+    from datetime import datetime
+
+    now = datetime.now()
+    hour = now.hour % 12 or 12
+    am_pm = "AM" if now.hour < 12 else "PM"
+    return f"{_MONTHS[now.month - 1]} {now.day:02d}, {now.year} at {hour:02d}:{now.minute:02d} {am_pm}"
+
 def get_sensors_file_path():
     """Get the path to the sensors.json file in the user's extension directory."""
     user_path = bpy.utils.extension_path_user(__package__, create=True)
     return os.path.join(user_path, 'sensors.json')
 
+def build_lookup_tables():
+    """Flatten SENSOR_DATA into the lookup tables and sorted enum items.
+
+    Names are interned so the keys and enum items share one string object
+    per manufacturer, model and format. Missing or null entries are skipped
+    with .get() chains rather than exception handling.
+    """
+    global SENSOR_DIMS, SENSOR_RES, MFRS_SORTED, MODELS_BY_MFR, FORMATS_BY
+    SENSOR_DIMS = {}
+    SENSOR_RES = {}
+    MODELS_BY_MFR = {}
+    FORMATS_BY = {}
+    for mfr, models in SENSOR_DATA.items():
+        mfr = sys.intern(mfr)
+        model_names = []
+        for model, model_data in models.items():
+            model = sys.intern(model)
+            model_names.append(model)
+            format_names = []
+            for fmt, format_data in (model_data.get("sensor dimensions") or {}).items():
+                fmt = sys.intern(fmt)
+                format_names.append(fmt)
+                key = (mfr, model, fmt)
+                mm = format_data.get("mm") or {}
+                if mm.get("width") and mm.get("height"):
+                    SENSOR_DIMS[key] = (mm["width"], mm["height"])
+                res = format_data.get("resolution") or {}
+                if isinstance(res.get("width"), int) and isinstance(res.get("height"), int):
+                    SENSOR_RES[key] = (res["width"], res["height"])
+            FORMATS_BY[(mfr, model)] = tuple((f, f, "") for f in sorted(format_names))
+        MODELS_BY_MFR[mfr] = tuple((m, m, "") for m in sorted(model_names))
+    MFRS_SORTED = tuple((m, m, "") for m in sorted(MODELS_BY_MFR))
+
+def get_cache_file_path(file_path):
+    """Get the path of the parsed-data cache kept next to sensors.json."""
+    return file_path + ".pkl"
+
+def read_cache(cache_path, stamp):
+    """Return the cached data and lookup tables if the cache matches stamp, else None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, tables = pickle.load(f)
+    except Exception:
+        # A missing, stale-format or corrupt cache just means parsing the JSON.
+        return None
+    return tables if cached_stamp == stamp else None
+
+def write_cache(cache_path, stamp, tables):
+    """Atomically write the parsed data and lookup tables to the cache."""
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stamp, tables), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Camera Sensor Database: Could not write cache: {e}")
+
 def load_sensor_data():
-    """Load the sensor data from the JSON file into the global SENSOR_DATA dict."""
-    global SENSOR_DATA
+    """Load the sensor data from the JSON file and rebuild the lookup tables.
+
+    The parsed result is cached next to the JSON file, stamped with its
+    modification time and size, so unchanged data is never parsed twice.
+    """
+    global SENSOR_DATA, SENSOR_DIMS, SENSOR_RES, MFRS_SORTED, MODELS_BY_MFR, FORMATS_BY
     file_path = get_sensors_file_path()
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, 'r') as f:
-                SENSOR_DATA = json.load(f)
-            print("Camera Sensor Database: Loaded sensor data.")
-        except json.JSONDecodeError:
-            SENSOR_DATA = {}
-            print("Camera Sensor Database: Error reading sensors.json file.")
-    else:
+    if not os.path.exists(file_path):
         SENSOR_DATA = {}
         print("Camera Sensor Database: sensors.json not found.")
+        build_lookup_tables()
+        return
+
+    stat = os.stat(file_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = get_cache_file_path(file_path)
+    tables = read_cache(cache_path, stamp)
+    if tables is not None:
+        SENSOR_DATA, SENSOR_DIMS, SENSOR_RES, MFRS_SORTED, MODELS_BY_MFR, FORMATS_BY = tables
+        print("Camera Sensor Database: Loaded sensor data from cache.")
+        return
+
+    try:
+        with open(file_path, 'rb') as f:
+            SENSOR_DATA = json_loads(f.read())
+        print("Camera Sensor Database: Loaded sensor data.")
+    except json.JSONDecodeError:
+        SENSOR_DATA = {}
+        print("Camera Sensor Database: Error reading sensors.json file.")
+        build_lookup_tables()
+        return
+
+    build_lookup_tables()
+    write_cache(cache_path, stamp, (SENSOR_DATA, SENSOR_DIMS, SENSOR_RES, MFRS_SORTED, MODELS_BY_MFR, FORMATS_BY))
+
+def ensure_loaded():
+    """Load the sensor data if it has not been loaded yet."""
+    global _DATA_LOADED
+    if not _DATA_LOADED:
+        load_sensor_data()
+        _DATA_LOADED = True
 
 # --- Dynamic Enum Callbacks ---
 def get_manufacturers(self, context):
-    items = [(m, m, "") for m in SENSOR_DATA.keys()]
-    return sorted(items) if items else [("NONE", "No Data Found", "Please download the database in Add-on Preferences.")]
+    ensure_loaded()
+    return MFRS_SORTED or FALLBACK_NONE
 
+# Blender passes the owning CSD_SensorProperties as self (context may be
+# None), so the selection is read from it directly. Unselected or "NONE"
+# parents are never keys in the tables, so a single lookup covers them too.
 def get_models(self, context):
-    props = context.scene.csd_sensor_properties
-    if not props.manufacturers or props.manufacturers == "NONE":
-        return [("NONE", "N/A", "")]
-    
-    models = SENSOR_DATA.get(props.manufacturers, {}).keys()
-    items = [(m, m, "") for m in models]
-    return sorted(items) if items else [("NONE", "N/A", "")]
-    
+    return MODELS_BY_MFR.get(self.manufacturers) or FALLBACK_NA
+
 def get_formats(self, context):
-    props = context.scene.csd_sensor_properties
-    if not props.manufacturers or not props.models or props.manufacturers == "NONE" or props.models == "NONE":
-        return [("NONE", "N/A", "")]
-        
-    formats = SENSOR_DATA.get(props.manufacturers, {}).get(props.models, {}).get("sensor dimensions", {}).keys()
-    items = [(f, f, "") for f in formats]
-    return sorted(items) if items else [("NONE", "N/A", "")]
+    return FORMATS_BY.get((self.manufacturers, self.models)) or FALLBACK_NA
+
+# Reset the dependent selection once per change, so the enums never hold an
+# index left over from the previous manufacturer or model.
+def update_manufacturer(self, context):
+    self.models = get_models(self, context)[0][0]
+
+def update_model(self, context):
+    self.formats = get_formats(self, context)[0][0]
 
 # --- Property Group ---
 class CSD_SensorProperties(bpy.types.PropertyGroup):
     
-    manufacturers: EnumProperty(items=get_manufacturers, name="Manufacturer")
-    models: EnumProperty(items=get_models, name="Model")
+    manufacturers: EnumProperty(items=get_manufacturers, name="Manufacturer", update=update_manufacturer)
+    models: EnumProperty(items=get_models, name="Model", update=update_model)
     formats: EnumProperty(items=get_formats, name="Format")
 
 # --- Operators ---
+def get_selected_key(props):
+    """Get the (manufacturer, model, format) lookup key for the current selection."""
+    return (props.manufacturers, props.models, props.formats)
+
 class CSD_OT_ApplySensor(bpy.types.Operator):
     """Applies the selected sensor dimensions to the active camera."""
     bl_idname = "csd.apply_sensor"
@@ -72,30 +208,24 @@ class CSD_OT_ApplySensor(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
+        ensure_loaded()
         props = context.scene.csd_sensor_properties
-        return context.camera is not None and props.formats and props.formats != "NONE"
+        return context.camera is not None and get_selected_key(props) in SENSOR_DIMS
 
     def execute(self, context):
         props = context.scene.csd_sensor_properties
-        try:
-            format_data = SENSOR_DATA[props.manufacturers][props.models]["sensor dimensions"][props.formats]["mm"]
-            width = format_data.get("width")
-            height = format_data.get("height")
-            
-            if width and height:
-                cam_data = context.camera
-                cam_data.sensor_fit = 'HORIZONTAL'
-                cam_data.sensor_width = width
-                cam_data.sensor_height = height
-                self.report({'INFO'}, f"Sensor set to: {width}mm x {height}mm")
-            else:
-                self.report({'WARNING'}, "Selected format has no sensor data.")
-                return {'CANCELLED'}
-
-        except KeyError:
-            self.report({'ERROR'}, "Could not apply sensor settings. Data not found.")
+        dims = SENSOR_DIMS.get(get_selected_key(props))
+        if not dims:
+            self.report({'WARNING'}, "Selected format has no sensor data.")
             return {'CANCELLED'}
 
+        width, height = dims
+        cam_data = context.camera
+        cam_data.sensor_fit = 'HORIZONTAL'
+        cam_data.sensor_width = width
+        cam_data.sensor_height = height
+        self.report({'INFO'}, f"Sensor set to: {width}mm x {height}mm")
+
         return {'FINISHED'}
 
 class CSD_OT_ApplyResolution(bpy.types.Operator):
@@ -105,120 +235,263 @@ class CSD_OT_ApplyResolution(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
+        ensure_loaded()
         props = context.scene.csd_sensor_properties
-        if not props.formats or props.formats == "NONE":
-            return False
-        
-        try:
-            res_data = SENSOR_DATA[props.manufacturers][props.models]["sensor dimensions"][props.formats]["resolution"]
-            width = res_data.get("width")
-            height = res_data.get("height")
-            return isinstance(width, int) and isinstance(height, int)
-        except (KeyError, TypeError):
-            return False
+        return get_selected_key(props) in SENSOR_RES
 
     def execute(self, context):
         props = context.scene.csd_sensor_properties
-        try:
-            res_data = SENSOR_DATA[props.manufacturers][props.models]["sensor dimensions"][props.formats]["resolution"]
-            width = res_data.get("width")
-            height = res_data.get("height")
-
-            if isinstance(width, int) and isinstance(height, int):
-                context.scene.render.resolution_x = width
-                context.scene.render.resolution_y = height
-                self.report({'INFO'}, f"Resolution set to: {width} x {height}")
-            else:
-                self.report({'WARNING'}, "Selected format has no resolution data.")
-                return {'CANCELLED'}
-
-        except KeyError:
-            self.report({'ERROR'}, "Could not apply resolution settings. Data not found.")
+        res = SENSOR_RES.get(get_selected_key(props))
+        if not res:
+            self.report({'WARNING'}, "Selected format has no resolution data.")
             return {'CANCELLED'}
 
+        width, height = res
+        context.scene.render.resolution_x = width
+        context.scene.render.resolution_y = height
+        self.report({'INFO'}, f"Resolution set to: {width} x {height}")
+
         return {'FINISHED'}
 
-class CSD_OT_CheckForUpdate(bpy.types.Operator):
+# --- Background Requests ---
+# Network requests run on a worker thread so Blender's UI stays responsive.
+# Workers only do I/O; the operators apply results to the preferences from
+# their modal handler on the main thread, as RNA is not thread-safe.
+_REQUEST_RUNNING = False
+
+class StdlibHTTP:
+    """Fallback for urllib3.PoolManager built on urllib.request, without keep-alive or gzip."""
+
+    def request(self, method, url, headers=None, preload_content=True):
+        import urllib.error
+        import urllib.request
+
+        headers = {k: v for k, v in (headers or {}).items() if k != 'Accept-Encoding'}
+        try:
+            response = urllib.request.urlopen(urllib.request.Request(url, headers=headers, method=method))
+        except urllib.error.HTTPError as e:
+            # Like urllib3, hand error statuses back instead of raising.
+            response = e
+        response.release_conn = response.close
+        return response
+
+    def clear(self):
+        pass
+
+def get_http():
+    """Get the shared HTTP pool, importing urllib3 on first use."""
+    global _HTTP
+    if _HTTP is None:
+        try:
+            import urllib3
+        except ImportError:
+            _HTTP = StdlibHTTP()
+        else:
+            _HTTP = urllib3.PoolManager(num_pools=2, maxsize=2, retries=urllib3.Retry(total=2, backoff_factor=0.3))
+    return _HTTP
+
+def run_in_background(func, *args):
+    """Run func(*args) on a daemon thread and return a queue for its (result, error)."""
+    results = queue.Queue(maxsize=1)
+
+    def worker():
+        try:
+            results.put((func(*args), None))
+        except Exception as e:
+            results.put((None, e))
+
+    threading.Thread(target=worker, daemon=True).start()
+    return results
+
+def fetch_remote_info(etag):
+    """Fetch the (sha, etag) of the remote database, or None if it is unchanged since etag."""
+    # Send the ETag from the last check so GitHub can answer with an
+    # empty 304 when the database has not changed.
+    headers = {**REQUEST_HEADERS, 'Accept': 'application/vnd.github.object+json'}
+    if etag:
+        headers['If-None-Match'] = etag
+
+    response = _HTTP.request('GET', API_URL, headers=headers, preload_content=False)
+    try:
+        if response.status == 304:
+            return None
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+
+        data = json.loads(response.read())
+        return data.get('sha', ""), response.headers.get('ETag', "")
+    finally:
+        response.release_conn()
+
+def git_blob_sha(file_path):
+    """Compute the Git blob SHA of a file, as reported by the GitHub Contents API."""
+    sha = hashlib.sha1(b"blob %d\0" % os.path.getsize(file_path), usedforsecurity=False)
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(1 << 16):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def download_sensors(file_path):
+    """Download the sensor database to file_path and return its Git blob SHA."""
+    response = _HTTP.request('GET', SENSORS_URL, headers=REQUEST_HEADERS, preload_content=False)
+    try:
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+
+        # Write to a temporary file first so an interrupted download
+        # never leaves a truncated sensors.json behind.
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as out_file:
+                shutil.copyfileobj(response, out_file, 1 << 16)
+            # Hash the downloaded bytes locally instead of asking the API
+            # for the new SHA in a second request.
+            sha = git_blob_sha(tmp_path)
+            os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        # Drop the parsed-data cache of the old file.
+        cache_path = get_cache_file_path(file_path)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    finally:
+        response.release_conn()
+
+    return sha
+
+def update_prefs(prefs, values):
+    """Write values to the add-on preferences in one batch, skipping unchanged ones."""
+    for name, value in values.items():
+        if getattr(prefs, name) != value:
+            setattr(prefs, name, value)
+
+def redraw_areas(context, *area_types):
+    """Tag all areas of the given types for redraw."""
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type in area_types:
+                area.tag_redraw()
+
+class CSD_BackgroundRequest:
+    """Mixin for operators that wait on a background request from a modal timer."""
+
+    @classmethod
+    def poll(cls, context):
+        return not _REQUEST_RUNNING
+
+    def start_request(self, context, func, *args):
+        global _REQUEST_RUNNING
+        _REQUEST_RUNNING = True
+        # Create the pool here on the main thread, before the worker uses it.
+        get_http()
+        self._results = run_in_background(func, *args)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or self._results.empty():
+            return {'PASS_THROUGH'}
+
+        self.stop_request(context)
+        result, error = self._results.get()
+        return self.apply_result(context, result, error)
+
+    def cancel(self, context):
+        self.stop_request(context)
+
+    def stop_request(self, context):
+        global _REQUEST_RUNNING
+        _REQUEST_RUNNING = False
+        context.window_manager.event_timer_remove(self._timer)
+
+
+class CSD_OT_CheckForUpdate(CSD_BackgroundRequest, bpy.types.Operator):
     """Checks if a new sensor database is available."""
     bl_idname = "csd.check_for_update"
     bl_label = "Check for Update"
 
     def execute(self, context):
         prefs = context.preferences.addons[__package__].preferences
-        
-        try:
-            if not bpy.app.online_access:
-                self.report({'WARNING'}, "Internet access is disabled.")
-                return {'CANCELLED'}
-
-            with urllib.request.urlopen(API_URL) as response:
-                if response.status != 200:
-                    self.report({'ERROR'}, f"Failed to check for updates (HTTP {response.status})")
-                    return {'CANCELLED'}
-                
-                data = json.loads(response.read())
-                remote_sha = data.get('sha')
-                
-                if remote_sha and remote_sha != prefs.remote_sha:
-                    prefs.update_available = True
-                    self.report({'INFO'}, "An update for the sensor database is available.")
-                else:
-                    prefs.update_available = False
-                    self.report({'INFO'}, "Sensor database is up to date.")
-                
-                prefs.last_checked = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-        
-        except Exception as e:
-            self.report({'ERROR'}, f"Update check failed: {e}")
+
+        if not bpy.app.online_access:
+            self.report({'WARNING'}, "Internet access is disabled.")
+            return {'CANCELLED'}
+
+        return self.start_request(context, fetch_remote_info, prefs.remote_etag)
+
+    def apply_result(self, context, result, error):
+        prefs = context.preferences.addons[__package__].preferences
+
+        if error is not None:
+            self.report({'ERROR'}, f"Update check failed: {error}")
             return {'CANCELLED'}
 
+        pending = {'last_checked': get_timestamp()}
+
+        # No result means nothing changed since the last check, so the
+        # previous result still holds.
+        if result is not None:
+            remote_sha, pending['remote_etag'] = result
+            pending['update_available'] = bool(remote_sha and remote_sha != prefs.remote_sha)
+
+        if pending.get('update_available', prefs.update_available):
+            self.report({'INFO'}, "An update for the sensor database is available.")
+        else:
+            self.report({'INFO'}, "Sensor database is up to date.")
+
+        update_prefs(prefs, pending)
+        redraw_areas(context, 'PREFERENCES')
+
         return {'FINISHED'}
 
 
-class CSD_OT_UpdateSensors(bpy.types.Operator):
+class CSD_OT_UpdateSensors(CSD_BackgroundRequest, bpy.types.Operator):
     """Downloads the latest sensor database."""
     bl_idname = "csd.update_sensors"
     bl_label = "Download Update"
 
     def execute(self, context):
-        prefs = context.preferences.addons[__package__].preferences
-        file_path = get_sensors_file_path()
+        if not bpy.app.online_access:
+            self.report({'WARNING'}, "Internet access is disabled in Blender preferences. Cannot update sensor database.")
+            return {'CANCELLED'}
 
-        try:
-            if not bpy.app.online_access:
-                self.report({'WARNING'}, "Internet access is disabled in Blender preferences. Cannot update sensor database.")
-                return {'CANCELLED'}
+        self._file_path = get_sensors_file_path()
+        self.report({'INFO'}, f"Downloading sensor database from {SENSORS_URL}...")
 
-            self.report({'INFO'}, f"Downloading sensor database from {SENSORS_URL}...")
-            
-            req = urllib.request.Request(SENSORS_URL)
-            with urllib.request.urlopen(req) as response, open(file_path, 'wb') as out_file:
-                out_file.write(response.read())
-
-            # After downloading, we need to get the new SHA
-            with urllib.request.urlopen(API_URL) as api_response:
-                data = json.loads(api_response.read())
-                prefs.remote_sha = data.get('sha')
-
-            prefs.update_available = False
-            prefs.last_checked = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-            self.report({'INFO'}, f"Sensor database saved to {file_path}")
-            
-            # Reload data after downloading
-            load_sensor_data()
-            
-            return {'FINISHED'}
+        return self.start_request(context, download_sensors, self._file_path)
 
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to download or save sensor database: {e}")
+    def apply_result(self, context, result, error):
+        global _DATA_LOADED
+        prefs = context.preferences.addons[__package__].preferences
+
+        if error is not None:
+            self.report({'ERROR'}, f"Failed to download or save sensor database: {error}")
             return {'CANCELLED'}
 
+        update_prefs(prefs, {
+            'remote_sha': result,
+            'last_checked': get_timestamp(),
+            'update_available': False,
+        })
+        self.report({'INFO'}, f"Sensor database saved to {self._file_path}")
+
+        # Reload data on the next UI access after downloading
+        _DATA_LOADED = False
+        redraw_areas(context, 'PREFERENCES', 'PROPERTIES')
+
+        return {'FINISHED'}
+
 
 # --- Add-on Preferences ---
 class CSD_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
     remote_sha: StringProperty(name="Remote SHA", default="")
+    remote_etag: StringProperty(name="Remote ETag", default="")
     last_checked: StringProperty(name="Last Checked", default="Never")
     update_available: BoolProperty(name="Update Available", default=False)
 
@@ -257,6 +530,7 @@ class CSD_PT_MainPanel(bpy.types.Panel):
         return context.camera is not None
 
     def draw(self, context):
+        ensure_loaded()
         layout = self.layout
         props = context.scene.csd_sensor_properties
         
@@ -292,19 +566,20 @@ classes = (
     CSD_PT_MainPanel,
 )
 
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-        
+    register_classes()
     bpy.types.Scene.csd_sensor_properties = PointerProperty(type=CSD_SensorProperties)
-    
-    load_sensor_data()
 
 def unregister():
+    global _HTTP
     del bpy.types.Scene.csd_sensor_properties
-        
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
+
+    if _HTTP is not None:
+        _HTTP.clear()
+        _HTTP = None
 
 if __name__ == "__main__":
     register()